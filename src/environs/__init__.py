@@ -7,12 +7,13 @@ import decimal
 import functools
 import inspect
 import json as pyjson
+import math
 import os
 import re
 import typing
 import uuid
-from collections.abc import Mapping
 from pathlib import Path
+from types import MethodType
 from urllib.parse import ParseResult
 
 import marshmallow as ma
@@ -60,6 +61,79 @@ validate = ma.validate
 ValidationError = ma.ValidationError
 
 
+# Built-in fields that deserialize strings to immutable values. Their results
+# only depend on the field's configuration and the raw string, so they can be
+# shared between reads.
+_MEMOIZABLE_FIELDS = frozenset(
+    (
+        ma.fields.Integer,
+        ma.fields.Boolean,
+        ma.fields.String,
+        ma.fields.Float,
+        ma.fields.Decimal,
+        ma.fields.DateTime,
+        ma.fields.Date,
+        ma.fields.Time,
+        ma.fields.UUID,
+        ma.fields.Enum,
+        fields.TimeDelta,
+        fields.Path,
+        fields.LogLevel,
+        fields.Url,
+    )
+)
+
+
+@functools.lru_cache(maxsize=1024)
+def _deserialize_cached(field: ma.fields.Field, value: str) -> typing.Any:
+    return field.deserialize(value)
+
+
+def _to_bool(value: str) -> bool:
+    if value in ma.fields.Boolean.truthy:
+        return True
+    if value in ma.fields.Boolean.falsy:
+        return False
+    raise ValueError(value)
+
+
+def _to_float(value: str) -> float:
+    num = float(value)
+    if not math.isfinite(num):
+        raise ValueError(value)
+    return num
+
+
+def _to_decimal(value: str) -> decimal.Decimal:
+    num = decimal.Decimal(value)
+    if not num.is_finite():
+        raise ValueError(value)
+    return num
+
+
+# Plain Python equivalents of how default-configured fields deserialize a string.
+# They raise ValueError or ArithmeticError for any input the field would reject or
+# handle specially (e.g. "nan"); the field is then used so errors are unchanged.
+# Keyed by field class; typed as Any so parser factories can be looked up too.
+_FAST_COERCERS: dict[typing.Any, typing.Callable[[str], typing.Any]] = {
+    ma.fields.Raw: str,
+    ma.fields.String: str,
+    ma.fields.Integer: int,
+    ma.fields.Float: _to_float,
+    ma.fields.Decimal: _to_decimal,
+    ma.fields.Boolean: _to_bool,
+}
+
+
+def _coerce(
+    coerce: typing.Callable[[str], typing.Any], field: ma.fields.Field, value: str
+) -> typing.Any:
+    try:
+        return coerce(value)
+    except (ValueError, ArithmeticError):
+        return field.deserialize(value)
+
+
 def _field2method(
     field_or_factory: type[ma.fields.Field] | FieldFactory,
     method_name: str,
@@ -67,6 +141,11 @@ def _field2method(
     preprocess: typing.Callable | None = None,
     preprocess_kwarg_names: typing.Sequence[str] = tuple(),
 ) -> typing.Any:
+    coerce = None if preprocess else _FAST_COERCERS.get(field_or_factory)
+    is_field_class = isinstance(field_or_factory, type) and issubclass(
+        field_or_factory, ma.fields.Field
+    )
+
     def method(
         self: Env,
         name: str,
@@ -88,27 +167,33 @@ def _field2method(
                 "Env has already been sealed. New values cannot be parsed."
             )
         load_default = default if default is not Ellipsis else ma.missing
-        preprocess_kwargs = {
-            name: kwargs.pop(name) for name in preprocess_kwarg_names if name in kwargs
-        }
-        if isinstance(field_or_factory, type) and issubclass(
-            field_or_factory, ma.fields.Field
-        ):
-            field = field_or_factory(
-                validate=validate,
-                required=required,
-                load_default=load_default,
-                **kwargs,
-            )
-        else:
-            parsed_subcast = _make_subcast_field(subcast) if subcast else ma.fields.Raw
-            field = typing.cast(FieldFactory, field_or_factory)(
-                subcast=parsed_subcast,
-                validate=validate,
-                required=required,
-                load_default=load_default,
+        if kwargs:
+            preprocess_kwargs = {
+                name: kwargs.pop(name)
+                for name in preprocess_kwarg_names
+                if name in kwargs
+            }
+        else:  # Common case: no need to build the preprocess kwargs
+            preprocess_kwargs = kwargs
+        # Field classes receive the extra kwargs; subcasts go through preprocess
+        field, field_cached = _get_field(
+            field_or_factory,
+            is_field_class,
+            None if is_field_class else subcast,
+            validate=validate,
+            required=required,
+            load_default=load_default,
+            **(kwargs if is_field_class else {}),
+        )
+        try:
+            parsed_key, value, proxied_key = self._get_from_environ(
+                name, default=Ellipsis
             )
-        parsed_key, value, proxied_key = self._get_from_environ(name, default=Ellipsis)
+        except EnvError as error:  # cyclic variable reference
+            if self.eager:
+                raise
+            self._errors[self._get_key(name)].append(error.args[0])
+            return None
         self._fields[parsed_key] = field
         source_key = proxied_key or parsed_key
         if value is Ellipsis:
@@ -125,7 +210,13 @@ def _field2method(
         try:
             if preprocess:
                 value = preprocess(value, **preprocess_kwargs)
-            value = field.deserialize(value)
+            if coerce is not None and validate is None and not kwargs:
+                value = _coerce(coerce, field, value)
+            elif field_cached and type(field) in _MEMOIZABLE_FIELDS:
+                # Only shared fields can produce cache hits
+                value = _deserialize_cached(field, value)
+            else:
+                value = field.deserialize(value)
         except ma.ValidationError as error:
             if self.eager:
                 raise EnvValidationError(
@@ -141,7 +232,68 @@ def _field2method(
     return method
 
 
+def _make_field(
+    field_or_factory: type[ma.fields.Field] | FieldFactory,
+    is_field_class: bool,
+    subcast: Subcast | None,
+    field_kwargs: typing.Mapping[str, typing.Any],
+) -> ma.fields.Field:
+    if is_field_class:
+        return typing.cast(type[ma.fields.Field], field_or_factory)(**field_kwargs)
+    parsed_subcast = _make_subcast_field(subcast) if subcast else ma.fields.Raw
+    return typing.cast(FieldFactory, field_or_factory)(
+        subcast=parsed_subcast, **field_kwargs
+    )
+
+
+@functools.lru_cache(maxsize=256)
+def _make_field_cached(key: tuple[typing.Any, ...]) -> ma.fields.Field:
+    field_or_factory, is_field_class, subcast, field_items = key
+    return _make_field(field_or_factory, is_field_class, subcast, dict(field_items))
+
+
+def _is_hashable(value: typing.Any) -> bool:
+    try:
+        hash(value)
+    except TypeError:
+        return False
+    return True
+
+
+def _get_field(
+    field_or_factory: type[ma.fields.Field] | FieldFactory,
+    is_field_class: bool,
+    subcast: Subcast | None,
+    **field_kwargs,
+) -> tuple[ma.fields.Field, bool]:
+    """Get a field for the given arguments, reusing a previously constructed
+    instance when the arguments are hashable. Returns the field and whether
+    it came from the cache.
+
+    Fields aren't mutated by deserialization and `Env.dump` copies them, so
+    sharing an instance between variables and `Env` instances is safe.
+    Validators and fields passed inline (e.g. ``by_value=ma.fields.Int()``) are
+    usually new objects on every call, so such fields are always constructed
+    fresh.
+    """
+    if field_kwargs["validate"] is None and not any(
+        isinstance(value, ma.fields.Field) for value in field_kwargs.values()
+    ):
+        key = (
+            field_or_factory,
+            is_field_class,
+            subcast,
+            tuple(sorted(field_kwargs.items())),
+        )
+        if _is_hashable(key):  # not the case for e.g. schemes={"redis"}
+            return _make_field_cached(key), True
+    return _make_field(field_or_factory, is_field_class, subcast, field_kwargs), False
+
+
 def _func2method(func: typing.Callable[..., _T], method_name: str) -> typing.Any:
+    # Custom parsers are dumped as-is, so one Raw field serves every call
+    raw_field = ma.fields.Raw()
+
     def method(
         self: Env,
         name: str,
@@ -152,8 +304,14 @@ def _func2method(func: typing.Callable[..., _T], method_name: str) -> typing.Any
             raise EnvSealedError(
                 "Env has already been sealed. New values cannot be parsed."
             )
-        parsed_key, raw_value, proxied_key = self._get_from_environ(name, default)
-        self._fields[parsed_key] = ma.fields.Raw()
+        try:
+            parsed_key, raw_value, proxied_key = self._get_from_environ(name, default)
+        except EnvError as error:  # cyclic variable reference
+            if self.eager:
+                raise
+            self._errors[self._get_key(name)].append(error.args[0])
+            return None
+        self._fields[parsed_key] = raw_field
         source_key = proxied_key or parsed_key
         if raw_value is Ellipsis:
             if self.eager:
@@ -163,10 +321,6 @@ def _func2method(func: typing.Callable[..., _T], method_name: str) -> typing.Any
             else:
                 self._errors[parsed_key].append("Environment variable not set.")
                 return None
-        if raw_value or raw_value == "":
-            value = raw_value
-        else:
-            value = None
         try:
             value = func(raw_value, **kwargs)
         except (EnvError, ma.ValidationError) as error:
@@ -181,9 +335,10 @@ def _func2method(func: typing.Callable[..., _T], method_name: str) -> typing.Any
                     messages,
                 ) from error
             self._errors[parsed_key].extend(messages)
-        else:
-            self._values[parsed_key] = value
-        return typing.cast(typing.Optional[_T], value)
+            # Deferred validation: hand back the unparsed value (None if falsy)
+            return raw_value if raw_value or raw_value == "" else None
+        self._values[parsed_key] = value
+        return value
 
     method.__name__ = method_name
     return method
@@ -217,12 +372,22 @@ def _make_list_field(*, subcast: Subcast | None, **kwargs) -> ma.fields.List:
     return ma.fields.List(inner_field, **kwargs)
 
 
+@functools.lru_cache(maxsize=128)
+def _schema_from_fields(
+    items: tuple[tuple[str, ma.fields.Field], ...],
+) -> type[ma.Schema]:
+    """Build a Schema class for ``dump``. Parsers reuse cached field instances,
+    so repeated dumps of the same variables reuse the same class.
+    """
+    return ma.Schema.from_dict(dict(items))
+
+
 def _preprocess_list(
     value: str | typing.Iterable, *, delimiter: str = ",", **kwargs
 ) -> typing.Iterable:
-    if ma.utils.is_iterable_but_not_string(value) or value is None:
-        return value
-    return typing.cast(str, value).split(delimiter) if value != "" else []
+    if isinstance(value, str):
+        return value.split(delimiter) if value else []
+    return value
 
 
 def _preprocess_dict(
@@ -233,8 +398,10 @@ def _preprocess_dict(
     delimiter: str = ",",
     **kwargs,
 ) -> typing.Mapping:
-    if isinstance(value, Mapping):
+    if not isinstance(value, str):
         return value
+    if not value:
+        return {}
     subcast_keys_instance: ma.fields.Field
     if subcast_keys:
         subcast_keys_instance = _make_subcast_field(subcast_keys)(**kwargs)
@@ -245,12 +412,11 @@ def _preprocess_dict(
         subcast_values_instance = _make_subcast_field(subcast_values)(**kwargs)
     else:
         subcast_values_instance = ma.fields.Raw()
-
+    load_key = subcast_keys_instance.deserialize
+    load_value = subcast_values_instance.deserialize
     return {
-        subcast_keys_instance.deserialize(
-            key.strip()
-        ): subcast_values_instance.deserialize(val.strip())
-        for key, val in (item.split("=", 1) for item in value.split(delimiter) if value)
+        load_key(key.strip()): load_value(val.strip())
+        for key, val in (item.split("=", 1) for item in value.split(delimiter))
     }
 
 
@@ -370,6 +536,7 @@ class Env:
         self._errors: ErrorMapping = collections.defaultdict(list)
         self._prefix: _StrType | None = prefix
         self.__custom_parsers__: dict[_StrType, ParserMethod] = {}
+        self._expstr_cache: dict[_StrType, tuple[typing.Any, ...]] = {}
 
     def __repr__(self) -> _StrType:
         return f"<{self.__class__.__name__}(eager={self.eager}, expand_vars={self.expand_vars})>"  # noqa: E501
@@ -456,9 +623,11 @@ class Env:
 
     def __getattr__(self, name: _StrType):
         try:
-            return functools.partial(self.__custom_parsers__[name], self)
+            method = self.__custom_parsers__[name]
         except KeyError as error:
             raise AttributeError(f"{self} has no attribute {name}") from error
+        bound = self.__dict__[name] = MethodType(method, self)
+        return bound
 
     def add_parser(self, name: _StrType, func: typing.Callable) -> None:
         """Register a new parser method with the name ``name``. ``func`` must
@@ -468,7 +637,7 @@ class Env:
             raise ParserConflictError(
                 f"Env already has a method with name '{name}'. Use a different name."
             )
-        self.__custom_parsers__[name] = _func2method(func, method_name=name)
+        self._register_parser(name, _func2method(func, method_name=name))
         return None
 
     def parser_for(
@@ -488,17 +657,43 @@ class Env:
         """Register a new parser method with name ``name``,
         given a marshmallow ``Field``.
         """
-        self.__custom_parsers__[name] = _field2method(field_cls, method_name=name)
-
-    def dump(self) -> typing.Mapping[_StrType, typing.Any]:
+        self._register_parser(name, _field2method(field_cls, method_name=name))
+
+    def _register_parser(self, name: _StrType, method: ParserMethod) -> None:
+        self.__custom_parsers__[name] = method
+        # Bind eagerly so that lookups don't go through __getattr__.
+        # Names defined on the class keep taking precedence.
+        if not hasattr(type(self), name):
+            self.__dict__[name] = MethodType(method, self)
+
+    def dump(
+        self, keys: typing.Iterable[_StrType] | None = None
+    ) -> typing.Mapping[_StrType, typing.Any]:
         """Dump parsed environment variables to a dictionary of simple data types
         (numbers and strings).
+
+        :param keys: Names of the variables to dump. By default, all parsed
+            variables are dumped. Names that haven't been parsed are ignored.
         """
-        schema = ma.Schema.from_dict(self._fields)()
+        if isinstance(keys, str):
+            raise TypeError(
+                f"keys must be an iterable of names, not a string. Use [{keys!r}]."
+            )
+        if keys is None:
+            field_map = self._fields
+        else:
+            field_map = {key: self._fields[key] for key in keys if key in self._fields}
+        schema = _schema_from_fields(tuple(field_map.items()))()
         return schema.dump(self._values)
 
     def _get_from_environ(
-        self, key: _StrType, default: typing.Any, *, proxied: _BoolType = False
+        self,
+        key: _StrType,
+        default: typing.Any,
+        *,
+        proxied: _BoolType = False,
+        memo: _DictType[tuple[_StrType, typing.Any], typing.Any] | None = None,
+        path: tuple[_StrType, ...] = (),
     ) -> tuple[_StrType, typing.Any, _StrType | None]:
         """Access a value from os.environ. Handles proxied variables,
         e.g. SMTP_LOGIN={{MAILGUN_LOGIN}}.
@@ -508,12 +703,19 @@ class Env:
         will be None if the envvar isn't proxied.
 
         The ``proxied`` flag is recursively passed if a proxy lookup is required
-        to get a proxy env key.
+        to get a proxy env key. ``memo`` maps ``(key, default)`` pairs to values
+        already resolved during the current expansion. ``path`` holds the keys
+        currently being expanded and is used to detect cyclic references.
         """
         env_key = self._get_key(key, omit_prefix=proxied)
         value = os.environ.get(env_key, default)
-        if hasattr(value, "strip"):
-            expand_match = self.expand_vars and _EXPANDED_VAR_PATTERN.match(value)
+        # Most values contain no "$", so skip the expansion logic for them
+        if self.expand_vars and isinstance(value, str) and "$" in value:
+            if env_key in path:
+                cycle = " -> ".join((*path, env_key))
+                raise EnvError(f"Cyclic variable reference: {cycle}")
+            path = (*path, env_key)
+            expand_match = _EXPANDED_VAR_PATTERN.match(value)
             if expand_match:  # Full match expand_vars - special case keep default
                 proxied_key: _StrType = expand_match.groups()[0]
                 subs_default: _StrType | None = expand_match.groups()[1]
@@ -525,37 +727,61 @@ class Env:
                     default = Ellipsis
                 return (
                     key,
-                    self._get_from_environ(proxied_key, default, proxied=True)[1],
+                    self._get_from_environ(
+                        proxied_key, default, proxied=True, memo=memo, path=path
+                    )[1],
                     proxied_key,
                 )
-            expand_search = self.expand_vars and _EXPANDED_VAR_PATTERN.search(value)
+            expand_parts = self._parse_expstr(value)
             if (
-                expand_search
+                len(expand_parts) > 1
             ):  # Multiple or in text match expand_vars - General case - default lost
-                return self._expand_vars(env_key, value)
+                return self._expand_vars(env_key, expand_parts, memo=memo, path=path)
             # Remove escaped $
-            if self.expand_vars and r"\$" in value:
-                value = value.replace(r"\$", "$")
+            value = value.replace(r"\$", "$")
         return env_key, value, None
 
-    def _expand_vars(self, parsed_key, value):
-        ret = ""
-        prev_start = 0
-        for match in _EXPANDED_VAR_PATTERN.finditer(value):
-            env_key = match.group(1)
-            env_default = match.group(2)
-            if env_default is None:
-                env_default = Ellipsis
-            else:
-                env_default = env_default[2:]  # trim ':-' from default
-            _, env_value, _ = self._get_from_environ(env_key, env_default, proxied=True)
+    def _parse_expstr(self, value: _StrType) -> tuple[typing.Any, ...]:
+        """Split a string containing ``${VAR}`` references into a tuple of
+        alternating literal strings and ``(name, default)`` pairs, e.g.
+        ``("Hello ", ("NAME", Ellipsis), "!")``. Results are cached per raw string.
+        """
+        try:
+            return self._expstr_cache[value]
+        except KeyError:
+            pass
+        # split() yields [literal, name, default, literal, name, default, ..., literal]
+        tokens = _EXPANDED_VAR_PATTERN.split(value)
+        parts: _ListType[typing.Any] = [tokens[0]]
+        for i in range(1, len(tokens), 3):
+            env_default = tokens[i + 1]
+            # trim ':-' from default
+            parts.append(
+                (tokens[i], Ellipsis if env_default is None else env_default[2:])
+            )
+            parts.append(tokens[i + 2])
+        ret = self._expstr_cache[value] = tuple(parts)
+        return ret
+
+    def _expand_vars(self, parsed_key, parts, *, memo=None, path=()):
+        if memo is None:
+            memo = {}
+        ret = [parts[0]]
+        env_key = None
+        for (env_key, env_default), literal in zip(parts[1::2], parts[2::2]):
+            try:
+                env_value = memo[env_key, env_default]
+            except KeyError:
+                _, env_value, _ = self._get_from_environ(
+                    env_key, env_default, proxied=True, memo=memo, path=path
+                )
+                memo[env_key, env_default] = env_value
             if env_value is Ellipsis:
                 return parsed_key, env_value, env_key
-            ret += value[prev_start : match.start()] + env_value
-            prev_start = match.end()
-        ret += value[prev_start:]
+            ret.append(env_value)
+            ret.append(literal)
 
-        return parsed_key, ret, env_key
+        return parsed_key, "".join(ret), env_key
 
     def _get_key(self, key: _StrType, *, omit_prefix: _BoolType = False) -> _StrType:
         return self._prefix + key if self._prefix and not omit_prefix else key
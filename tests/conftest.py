@@ -0,0 +1,12 @@
+import pytest
+
+
+def pytest_collection_modifyitems(config, items):
+    # Timing-based tests are flaky on busy machines, so only run them when
+    # explicitly requested, e.g. `pytest -m perf`
+    if "perf" in config.getoption("markexpr"):
+        return
+    skip_perf = pytest.mark.skip(reason="perf tests run only with '-m perf'")
+    for item in items:
+        if "perf" in item.keywords:
+            item.add_marker(skip_perf)